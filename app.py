@@ -1,14 +1,24 @@
 import logging
 import os
+import queue
 import random
+import sqlite3
+import threading
 import traceback
 from collections import defaultdict
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
-from flask import Flask, abort, jsonify, render_template, request
+import orjson
+from flask import Flask, Response, abort, g, has_request_context, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import text
+from sqlalchemy import case, event, func, or_, select, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
 
 from checkout import find_checkout
 
@@ -17,18 +27,145 @@ from checkout import find_checkout
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson (C) instead of the stdlib encoder; jsonify and
+    request.get_json() go through it. Output matches Flask's default: sorted keys, and types
+    orjson does not handle natively (datetimes included) are converted by Flask's default().
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, static_folder="static", template_folder="templates")
+app.json = OrjsonProvider(app)
 base_dir = os.path.abspath(os.path.dirname(__file__))
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + os.path.join(base_dir, "darts.db")
+db_path = os.path.join(base_dir, "darts.db")
+app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + db_path
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    # Pooled connections are handed between request threads; validate them before reuse.
+    # Keeping a few open means the connect PRAGMAs below run once per connection, not per request.
+    # The pool covers gunicorn's request threads (see gunicorn.conf.py); a writer waits up to
+    # 15 s for SQLite's write lock instead of failing with "database is locked".
+    "connect_args": {"check_same_thread": False, "timeout": 15},
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection. WAL lets the scoreboard read while a throw is being
+    committed, and synchronous=NORMAL drops the fsync per commit (WAL stays crash-safe).
+    Reads go through a 256 MB memory map and a ~20 MB page cache.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 db = SQLAlchemy(app)
+# In-process cache for read-heavy endpoints (see _data_generation below for invalidation)
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 30})
+
+
+# Darts that may finish an X01 leg: any double (value, 2) plus the double bull (25, 2)
+VALID_FINISH = frozenset({(v, 2) for v in range(1, 21)} | {(25, 2)})
+
+
+def _dart_label(value, multiplier):
+    """Board label for a dart: BULL (50), SBULL (25), otherwise T/D/S + segment value."""
+    if value == 25 and multiplier == 2:
+        return "BULL"
+    if value == 25:
+        return "SBULL"
+    prefix = "T" if multiplier == 3 else ("D" if multiplier == 2 else "S")
+    return f"{prefix}{value}"
+
+
+# Labels for every dart the board can send (misses included), precomputed for game_state
+DART_LABELS = {(v, m): _dart_label(v, m) for v in (*range(0, 21), 25) for m in range(0, 4)}
+
+
+# Server-side UTC "now" for creation timestamps, so inserts bind no Python datetime. Millisecond
+# precision (CURRENT_TIMESTAMP only has seconds) keeps rows created in one request in order.
+UTC_NOW_DEFAULT = db.text("(strftime('%Y-%m-%d %H:%M:%f', 'now'))")
+
+# Columns declared with UTC_NOW_DEFAULT, as (table, column). SQLite cannot change a column
+# default in place; tools/migrate_db.py rebuilds older copies of these tables.
+SERVER_DEFAULT_COLUMNS = (
+    ("profile", "created_at"),
+    ("game", "created_at"),
+    ("match_set", "created_at"),
+    ("leg", "created_at"),
+    ("throw", "timestamp"),
+)
+
+
+def _columns_without_db_default() -> frozenset:
+    """
+    The SERVER_DEFAULT_COLUMNS that exist in darts.db without a database default, i.e. whose
+    table predates the default and tools/migrate_db.py has not run yet. Read with plain sqlite3
+    before the models are declared; a missing DB or table counts as migrated (create_all adds it).
+    """
+    if not os.path.exists(db_path):
+        return frozenset()
+    missing = set()
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            for table, col in SERVER_DEFAULT_COLUMNS:
+                # rows: (cid, name, type, notnull, dflt_value, pk, hidden)
+                for row in conn.execute("SELECT * FROM pragma_table_xinfo(?)", (table,)):
+                    if row[1] == col and row[4] is None:
+                        missing.add((table, col))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
+    return frozenset(missing)
+
+
+UNMIGRATED_DEFAULT_COLUMNS = _columns_without_db_default()
+
+
+def _now_column(table: str, name: str):
+    """
+    A creation timestamp column set by SQLite (UTC_NOW_DEFAULT). Until tools/migrate_db.py
+    has given the existing table that default, the value is supplied from Python instead.
+    """
+    if (table, name) in UNMIGRATED_DEFAULT_COLUMNS:
+        return db.Column(db.DateTime, server_default=UTC_NOW_DEFAULT, default=datetime.utcnow)
+    return db.Column(db.DateTime, server_default=UTC_NOW_DEFAULT)
 
 
 # Models
 class Profile(db.Model):
+    # created_at is part of the API payload right after creation; fetch it with INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(80), unique=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = _now_column("profile", "created_at")
+
+    game_players = db.relationship("Player", back_populates="profile")
 
 
 class Settings(db.Model):
@@ -54,10 +191,14 @@ class Settings(db.Model):
         }
 
 
+# Modes scored X01-style (count down, bust below zero or on 1, finish on a double).
+_X01_MODES = frozenset({"301", "501", "701", "1001", "1501"})
+
+
 class Game(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     mode = db.Column(db.String(50), default="501")
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = _now_column("game", "created_at")
 
     # Match/leg/set configuration and state
     # Number of legs a player must win to take a set (0 or None means no leg/set counting)
@@ -81,19 +222,36 @@ class Game(db.Model):
     # Whether the game/match is finished
     finished = db.Column(db.Boolean, default=False)
 
-    players = db.relationship("Player", backref="game", cascade="all, delete-orphan")
-    # Historical sets recorded for this game (see MatchSet -> Leg)
-    sets = db.relationship("MatchSet", backref="game", cascade="all, delete-orphan")
+    # Almost every game view reads its players, so they are selectin-loaded with the game by
+    # default (one extra IN query). Routes override this per query where a join is cheaper
+    # (joinedload) or the players are not needed (lazyload).
+    # Players keep their join order (id); the persisted start/active indexes refer to it.
+    players = db.relationship(
+        "Player", back_populates="game", cascade="all, delete-orphan", lazy="selectin", order_by="Player.id"
+    )
+    # Historical sets recorded for this game (see MatchSet -> Leg), in play order
+    sets = db.relationship(
+        "MatchSet", back_populates="game", cascade="all, delete-orphan", order_by="(MatchSet.set_number, MatchSet.id)"
+    )
+
+    @property
+    def is_x01(self) -> bool:
+        """True for X01 modes (301, 501, ...), which use bust and double-out rules."""
+        return str(self.mode) in _X01_MODES
 
 
 class Player(db.Model):
+    # Profile delete/reset and profile-backed stats look players up by profile_id.
+    __table_args__ = (db.Index("ix_player_profile", "profile_id"),)
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(80), default="Player")
     starting_score = db.Column(db.Integer, default=501)
     current_score = db.Column(db.Integer, default=501)
     profile_id = db.Column(db.Integer, db.ForeignKey("profile.id"), nullable=True)
-    profile = db.relationship("Profile", backref="game_players")
+    profile = db.relationship("Profile", back_populates="game_players")
     game_id = db.Column(db.Integer, db.ForeignKey("game.id"))
+    game = db.relationship("Game", back_populates="players")
 
     # Bot support: mark players that are automated bots and record a bot_type string.
     # Bots participate in scoring/turn rotation but do NOT have per-throw stats persisted.
@@ -104,11 +262,27 @@ class Player(db.Model):
     leg_wins = db.Column(db.Integer, default=0)
     set_wins = db.Column(db.Integer, default=0)
 
+    # Denormalized throw stats for this game-player, maintained by register_throw so that
+    # game_state does not need to scan the throw history on every request.
+    throw_count = db.Column(db.Integer, default=0)
+    total_scored = db.Column(db.Integer, default=0)
+    # Sum of the first nine recorded throws (basis for the first-9 average)
+    first9_sum = db.Column(db.Integer, default=0)
+
     # relationship to throws in this game
-    throws = db.relationship("Throw", backref="player", cascade="all, delete-orphan")
+    throws = db.relationship("Throw", back_populates="player", cascade="all, delete-orphan")
 
 
 class Throw(db.Model):
+    # Per-player and per-profile throw reads filter on the owner id and order by timestamp;
+    # the composite indexes serve both without a separate sort step. Profile totals
+    # (COUNT/SUM(scored)) are answered from ix_throw_profile_scored alone.
+    __table_args__ = (
+        db.Index("ix_throw_player_ts", "player_id", "timestamp"),
+        db.Index("ix_throw_profile_ts", "profile_id", "timestamp"),
+        db.Index("ix_throw_profile_scored", "profile_id", "scored"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey("player.id"))
     profile_id = db.Column(db.Integer, db.ForeignKey("profile.id"), nullable=True)
@@ -116,7 +290,13 @@ class Throw(db.Model):
     multiplier = db.Column(db.Integer)  # 0 = OUT/miss, 1 single, 2 double, 3 triple
     x = db.Column(db.Float, nullable=True)  # normalized x (0..1)
     y = db.Column(db.Float, nullable=True)  # normalized y (0..1)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    # Points of the dart, computed by SQLite (VIRTUAL: not stored, never written by inserts)
+    scored = db.Column(db.Integer, db.Computed("value * multiplier"))
+    # Set by SQLite on insert (see UTC_NOW_DEFAULT); darts with equal timestamps fall back to
+    # id order in queries.
+    timestamp = _now_column("throw", "timestamp")
+
+    player = db.relationship("Player", back_populates="throws")
 
 
 # Match history models
@@ -129,9 +309,12 @@ class MatchSet(db.Model):
     game_id = db.Column(db.Integer, db.ForeignKey("game.id"))
     set_number = db.Column(db.Integer, default=1)  # 1-based
     winner_player_id = db.Column(db.Integer, db.ForeignKey("player.id"), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = _now_column("match_set", "created_at")
 
-    legs = db.relationship("Leg", backref="match_set", cascade="all, delete-orphan")
+    game = db.relationship("Game", back_populates="sets")
+    legs = db.relationship(
+        "Leg", back_populates="match_set", cascade="all, delete-orphan", order_by="(Leg.leg_number, Leg.id)"
+    )
 
 
 class Leg(db.Model):
@@ -143,69 +326,81 @@ class Leg(db.Model):
     match_set_id = db.Column(db.Integer, db.ForeignKey("match_set.id"))
     leg_number = db.Column(db.Integer, default=1)  # 1-based within the set
     winner_player_id = db.Column(db.Integer, db.ForeignKey("player.id"), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = _now_column("leg", "created_at")
 
-
-# Ensure tables exist
-with app.app_context():
-    # Create any missing tables from the current models
-    db.create_all()
-
-    # Runtime compatibility step for older SQLite databases:
-    # If the DB was created with an older schema it may be missing the
-    # `profile_id` columns on `player` and `throw`. SQLite supports
-    # adding simple columns via ALTER TABLE ... ADD COLUMN, so attempt
-    # to add them if they're absent. We swallow errors so the app can
-    # still start even if this compatibility step can't run for some reason.
-    #
-    # Note: this does not (and cannot, easily) add foreign-key constraints
-    # to an existing SQLite table; it only adds the integer column so the
-    # ORM can read/write it going forward.
-    try:
-        engine = db.get_engine()
-        if engine.dialect.name == "sqlite":
-            conn = engine.connect()
-            try:
-
-                def _has_column(table, col):
-                    # PRAGMA table_info returns rows like: (cid, name, type, notnull, dflt_value, pk)
-                    res = conn.execute(f"PRAGMA table_info('{table}')").fetchall()
-                    return any(row[1] == col for row in res)
-
-                if not _has_column("player", "profile_id"):
-                    conn.execute("ALTER TABLE player ADD COLUMN profile_id INTEGER")
-                if not _has_column("throw", "profile_id"):
-                    # The table name 'throw' is simple, but quote it to be safe
-                    conn.execute('ALTER TABLE "throw" ADD COLUMN profile_id INTEGER')
-                # Backfill for newer game column added to persist the active player index across reloads
-                # Older DBs may be missing this column; add a simple integer defaulting to 0.
-                if not _has_column("game", "current_active_index"):
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN current_active_index INTEGER DEFAULT 0")
-                    except Exception:
-                        # Best-effort only; ignore failures to allow app to start with existing DB
-                        pass
-            finally:
-                conn.close()
-    except Exception:
-        # If anything goes wrong here we intentionally ignore it so the
-        # application can continue using the existing DB. The error can
-        # be investigated separately (logs/console) if needed.
-        pass
+    match_set = db.relationship("MatchSet", back_populates="legs")
 
 
 # Helpers
-def ensure_schema_compatibility():
+
+# Columns added to existing tables since their first release, as (column, SQLite column DDL).
+# SQLite stores booleans as INTEGER (0/1).
+COMPAT_COLUMNS = {
+    "player": (
+        ("profile_id", "INTEGER"),
+        ("leg_wins", "INTEGER DEFAULT 0"),
+        ("set_wins", "INTEGER DEFAULT 0"),
+        # Bot columns: mark player rows that represent automated bots and store a bot type
+        ("is_bot", "INTEGER DEFAULT 0"),
+        ("bot_type", "VARCHAR(32)"),
+        # Denormalized per-player throw stats (see STATS_COLUMNS)
+        ("throw_count", "INTEGER DEFAULT 0"),
+        ("total_scored", "INTEGER DEFAULT 0"),
+        ("first9_sum", "INTEGER DEFAULT 0"),
+    ),
+    "throw": (
+        ("profile_id", "INTEGER"),
+        ("x", "REAL"),
+        ("y", "REAL"),
+        # generated column; SQLite can only add VIRTUAL ones to an existing table
+        ("scored", "INTEGER GENERATED ALWAYS AS (value * multiplier) VIRTUAL"),
+    ),
+    # game columns added to support newer match/leg/set fields
+    "game": (
+        ("legs_to_win", "INTEGER"),
+        ("sets_to_win", "INTEGER"),
+        ("current_set", "INTEGER DEFAULT 1"),
+        ("current_leg", "INTEGER DEFAULT 1"),
+        ("first_throw_method", "VARCHAR(32) DEFAULT 'random'"),
+        ("current_start_index", "INTEGER DEFAULT 0"),
+        # persists/restores which player is to throw next
+        ("current_active_index", "INTEGER DEFAULT 0"),
+        ("finished", "INTEGER DEFAULT 0"),
+    ),
+}
+STATS_COLUMNS = ("throw_count", "total_scored", "first9_sum")
+
+# create_all() only creates indexes together with new tables, so the model indexes are
+# added to existing DBs by ensure_schema_compatibility().
+COMPAT_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS ix_throw_player_ts ON "throw" (player_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS ix_throw_profile_ts ON "throw" (profile_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS ix_throw_profile_scored ON "throw" (profile_id, scored)',
+    "CREATE INDEX IF NOT EXISTS ix_player_profile ON player (profile_id)",
+)
+
+# Set once ensure_schema_compatibility() has completed, so stray later calls return immediately.
+_SCHEMA_OK = False
+
+
+def ensure_schema_compatibility(force: bool = False):
     """
     Ensure commonly added columns/tables exist for older SQLite DBs:
-      - player.profile_id, player.leg_wins, player.set_wins
-      - throw.profile_id, throw.x, throw.y
-      - game.* columns added for match/leg support (legs_to_win, sets_to_win, first_throw_method, etc.)
+      - the columns listed in COMPAT_COLUMNS (player, throw and game) and the COMPAT_INDEXES
       - match_set and leg tables will be created by SQLAlchemy's create_all() for new installs.
 
     This function attempts ALTER TABLE ... ADD COLUMN for missing simple columns on SQLite.
+    Each table's schema is read once with PRAGMA table_xinfo (which, unlike table_info, also
+    lists generated columns) and checked locally.
+    Existing tables are never rebuilt: the SERVER_DEFAULT_COLUMNS their copy lacks a default for
+    are filled from Python (see _now_column) until tools/migrate_db.py has run.
+    It does not (and cannot, easily) add foreign-key constraints to existing SQLite tables.
     It's intentionally defensive and best-effort; use proper migrations for production.
+    After one completed run further calls are no-ops unless force=True.
     """
+    global _SCHEMA_OK
+    if _SCHEMA_OK and not force:
+        return
     try:
         try:
             engine = db.get_engine()
@@ -215,122 +410,211 @@ def ensure_schema_compatibility():
         if engine and getattr(engine, "dialect", None) and engine.dialect.name == "sqlite":
             conn = engine.connect()
             try:
-
-                def _has_column(table, col):
-                    res = conn.execute(f"PRAGMA table_info('{table}')").fetchall()
-                    return any(row[1] == col for row in res)
-
-                # player columns
-                if _has_column("player", "profile_id") is False:
-                    try:
-                        conn.execute("ALTER TABLE player ADD COLUMN profile_id INTEGER")
-                    except Exception:
-                        pass
-                if _has_column("player", "leg_wins") is False:
-                    try:
-                        conn.execute("ALTER TABLE player ADD COLUMN leg_wins INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                if _has_column("player", "set_wins") is False:
-                    try:
-                        conn.execute("ALTER TABLE player ADD COLUMN set_wins INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                # Bot columns: mark player rows that represent automated bots and store a bot type
-                if _has_column("player", "is_bot") is False:
-                    try:
-                        # SQLite uses INTEGER for booleans
-                        conn.execute("ALTER TABLE player ADD COLUMN is_bot INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                if _has_column("player", "set_wins") is False:
-                    try:
-                        conn.execute("ALTER TABLE player ADD COLUMN set_wins INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                # Bot columns: mark player rows that represent automated bots and store a bot type
-                if _has_column("player", "is_bot") is False:
+                added = set()
+                for table, columns in COMPAT_COLUMNS.items():
+                    # PRAGMA table_xinfo returns rows like: (cid, name, type, notnull, dflt_value, pk, hidden)
+                    existing = {row[1] for row in conn.execute(text(f"PRAGMA table_xinfo('{table}')"))}
+                    for col, ddl in columns:
+                        if col in existing:
+                            continue
+                        try:
+                            conn.execute(text(f'ALTER TABLE "{table}" ADD COLUMN {col} {ddl}'))
+                            added.add((table, col))
+                        except Exception:
+                            pass
+
+                # When the stats columns are added to an existing DB they are backfilled once
+                # from the recorded throws so running games keep their averages.
+                if any(("player", col) in added for col in STATS_COLUMNS):
                     try:
-                        # SQLite stores booleans as INTEGER (0/1)
-                        conn.execute("ALTER TABLE player ADD COLUMN is_bot INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                if _has_column("player", "bot_type") is False:
-                    try:
-                        conn.execute("ALTER TABLE player ADD COLUMN bot_type VARCHAR(32)")
+                        conn.execute(
+                            text(
+                                """
+                                UPDATE player SET
+                                  throw_count = (SELECT COUNT(*) FROM "throw" t WHERE t.player_id = player.id),
+                                  total_scored = (
+                                    SELECT COALESCE(SUM(t.value * t.multiplier), 0)
+                                    FROM "throw" t WHERE t.player_id = player.id
+                                  ),
+                                  first9_sum = (
+                                    SELECT COALESCE(SUM(f.scored), 0) FROM (
+                                      SELECT t.value * t.multiplier AS scored FROM "throw" t
+                                      WHERE t.player_id = player.id ORDER BY t.timestamp, t.id LIMIT 9
+                                    ) f
+                                  )
+                                """
+                            )
+                        )
+                        conn.commit()
                     except Exception:
                         pass
 
-                # throw columns
-                if _has_column("throw", "profile_id") is False:
-                    try:
-                        conn.execute('ALTER TABLE "throw" ADD COLUMN profile_id INTEGER')
-                    except Exception:
-                        pass
-                if _has_column("throw", "x") is False:
-                    try:
-                        conn.execute('ALTER TABLE "throw" ADD COLUMN x REAL')
-                    except Exception:
-                        pass
-                if _has_column("throw", "y") is False:
-                    try:
-                        conn.execute('ALTER TABLE "throw" ADD COLUMN y REAL')
-                    except Exception:
-                        pass
+                for table_name, col in sorted(UNMIGRATED_DEFAULT_COLUMNS):
+                    logger.info("%s.%s has no database default; run tools/migrate_db.py to add it", table_name, col)
 
-                # game columns (added to support newer match/leg/set fields)
-                # These columns are simple and nullable/defaulted so ALTER is safe on SQLite.
-                if _has_column("game", "legs_to_win") is False:
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN legs_to_win INTEGER")
-                    except Exception:
-                        pass
-                if _has_column("game", "sets_to_win") is False:
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN sets_to_win INTEGER")
-                    except Exception:
-                        pass
-                if _has_column("game", "current_set") is False:
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN current_set INTEGER DEFAULT 1")
-                    except Exception:
-                        pass
-                if _has_column("game", "current_leg") is False:
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN current_leg INTEGER DEFAULT 1")
-                    except Exception:
-                        pass
-                if _has_column("game", "first_throw_method") is False:
+                for index_ddl in COMPAT_INDEXES:
                     try:
-                        conn.execute("ALTER TABLE game ADD COLUMN first_throw_method VARCHAR(32) DEFAULT 'random'")
+                        conn.execute(text(index_ddl))
                     except Exception:
                         pass
-                if _has_column("game", "current_start_index") is False:
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN current_start_index INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                # Add current_active_index to allow persisting/restoring which player is to throw next.
-                if _has_column("game", "current_active_index") is False:
-                    try:
-                        conn.execute("ALTER TABLE game ADD COLUMN current_active_index INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                if _has_column("game", "finished") is False:
-                    try:
-                        # SQLite does not have native BOOLEAN type - use INTEGER default 0
-                        conn.execute("ALTER TABLE game ADD COLUMN finished INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-
             finally:
                 conn.close()
+        _SCHEMA_OK = True
     except Exception:
         # Best-effort only; migrations are recommended for production.
         pass
 
 
+# Create missing tables and run the compatibility step once at startup, so columns added
+# since the DB was created exist before the first request reads them.
+with app.app_context():
+    db.create_all()
+    ensure_schema_compatibility()
+
+
+def _record_throw_stats(player: Player, scored: int):
+    """Keep the denormalized per-player stats in step with a newly recorded Throw row."""
+    player.throw_count = (player.throw_count or 0) + 1
+    player.total_scored = (player.total_scored or 0) + scored
+    if player.throw_count <= 9:
+        player.first9_sum = (player.first9_sum or 0) + scored
+
+
+def _reset_profile_players(profile_id: int, unlink: bool = False):
+    """
+    Clear the denormalized stats of every player linked to a profile with one bulk UPDATE
+    (after the profile's Throw rows have been deleted). With unlink=True the link is removed too.
+    """
+    values = {Player.throw_count: 0, Player.total_scored: 0, Player.first9_sum: 0}
+    if unlink:
+        values[Player.profile_id] = None
+    Player.query.filter_by(profile_id=profile_id).update(values, synchronize_session=False)
+
+
+def _player_index(game_id: int, player_id: int):
+    """
+    0-based position of a player within game.players (ordered by id), or None if the player
+    is not part of the game. Resolved in SQL without loading the game's players.
+    """
+    earlier = (
+        select(func.count(Player.id))
+        .where(Player.game_id == game_id, Player.id < player_id)
+        .correlate(None)
+        .scalar_subquery()
+    )
+    return db.session.execute(select(earlier).where(Player.id == player_id, Player.game_id == game_id)).scalar()
+
+
+def _player_count(game_id: int) -> int:
+    return db.session.query(func.count(Player.id)).filter(Player.game_id == game_id).scalar()
+
+
+# Process-local like the cache itself (the app runs as one process, see gunicorn.conf.py).
+# Request threads bump it concurrently, so the increment is done under a lock: a lost
+# update could move the counter backwards and revive entries cached before a write.
+_data_gen = 0
+_data_gen_lock = threading.Lock()
+
+
+def _data_generation():
+    """
+    Counter that changes after every request that may have modified game data.
+    Cached read endpoints include it in their cache key, so any write invalidates them
+    without having to track which cached entries it affected.
+    """
+    return _data_gen
+
+
+@app.after_request
+def _bump_data_generation(response):
+    global _data_gen
+    # Settings only hold client preferences and are never part of a cached payload.
+    if request.method != "GET" and request.endpoint != "settings_api":
+        with _data_gen_lock:
+            _data_gen += 1
+    return response
+
+
+# Shared fallback for requests without a JSON body; read-only, never mutate it.
+EMPTY: dict = {}
+
+
+def _json_body() -> dict:
+    """The request's JSON object, or EMPTY when the body is missing, malformed or not an object."""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else EMPTY
+
+
+def _coerce_id(value):
+    """int(value) for an id sent by the client (e.g. "3"), or None if it is not a valid integer."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_or_404(model, ident, *options):
+    """Load a row by primary key via the session identity map (optionally with loader options), or abort with 404."""
+    obj = db.session.get(model, ident, options=options)
+    if obj is None:
+        abort(404)
+    return obj
+
+
+def _parse_dart(data):
+    """Return (value, multiplier) as ints from a dart payload, or None if malformed."""
+    if not isinstance(data, dict):
+        return None
+    try:
+        return int(data.get("value", 0)), int(data.get("multiplier", 0))
+    except (TypeError, ValueError):
+        return None
+
+
+# Debug-mode SQL statement counting per request, to surface N+1 regressions while developing.
+# Budgets are the worst case measured per endpoint (e.g. register_throw: 3 for a plain dart,
+# 10 when it also wins the match); endpoints without one use DEFAULT_QUERY_BUDGET.
+QUERY_BUDGETS = {
+    "game_state": 4,
+    "register_throw": 10,
+    "register_throws_batch": 12,
+    "new_game": 7,
+    "profile_stats": 4,
+}
+DEFAULT_QUERY_BUDGET = 5
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_request_queries(conn, cursor, statement, parameters, context, executemany):
+    if app.debug and has_request_context():
+        # statements of a stream push are collected separately (see _publish_game_state)
+        g.setdefault(g.get("query_bucket", "queries"), []).append(statement)
+
+
+@app.after_request
+def _report_query_count(response):
+    if app.debug:
+        queries = g.get("queries", [])
+        budget = QUERY_BUDGETS.get(request.endpoint, DEFAULT_QUERY_BUDGET)
+        if len(queries) > budget:
+            logger.warning(
+                "%s %s issued %d SQL statements (budget %d)", request.method, request.path, len(queries), budget
+            )
+        # A stream push rebuilds the game state, so it gets the game_state budget
+        pushed = g.get("publish_queries", [])
+        if len(pushed) > QUERY_BUDGETS["game_state"]:
+            logger.warning(
+                "%s %s issued %d SQL statements for its stream push (budget %d)",
+                request.method,
+                request.path,
+                len(pushed),
+                QUERY_BUDGETS["game_state"],
+            )
+    return response
+
+
 def profile_to_dict(p: Profile):
+    # Also accepts result rows selecting the same columns (see the GET /api/profiles listing).
     return {"id": p.id, "name": p.name, "created_at": p.created_at.isoformat()}
 
 
@@ -344,10 +628,17 @@ def index():
 @app.route("/api/profiles", methods=["GET", "POST"])
 def profiles():
     if request.method == "GET":
-        profs = Profile.query.order_by(Profile.name).all()
-        return jsonify([profile_to_dict(p) for p in profs])
+        # Profiles rarely change; serve the list from the cache until the next write.
+        cache_key = f"profiles:{_data_generation()}"
+        listing = cache.get(cache_key)
+        if listing is None:
+            # Plain column rows: no Profile instances or identity-map bookkeeping for a read-only list
+            rows = db.session.execute(select(Profile.id, Profile.name, Profile.created_at).order_by(Profile.name))
+            listing = [profile_to_dict(r) for r in rows]
+            cache.set(cache_key, listing)
+        return jsonify(listing)
     else:
-        data = request.json or {}
+        data = _json_body()
         name = (data.get("name") or "").strip()
         if not name:
             return jsonify({"error": "Name required"}), 400
@@ -357,8 +648,11 @@ def profiles():
         try:
             p = Profile(name=name)
             db.session.add(p)
+            # the flush fills id and created_at (RETURNING); build the payload before the commit expires them
+            db.session.flush()
+            payload = profile_to_dict(p)
             db.session.commit()
-            return jsonify(profile_to_dict(p)), 201
+            return jsonify(payload), 201
         except Exception as e:
             # rollback any partial transaction and return a JSON error
             try:
@@ -370,9 +664,9 @@ def profiles():
 
 @app.route("/api/profiles/<int:profile_id>", methods=["PATCH", "DELETE"])
 def profile_modify(profile_id):
-    profile = Profile.query.get_or_404(profile_id)
+    profile = _get_or_404(Profile, profile_id)
     if request.method == "PATCH":
-        data = request.json or {}
+        data = _json_body()
         name = data.get("name")
         if name:
             name = name.strip()
@@ -386,10 +680,8 @@ def profile_modify(profile_id):
         return jsonify(profile_to_dict(profile))
     else:
         # Delete profile: remove throws tied to profile and clear links from players
-        Throw.query.filter_by(profile_id=profile.id).delete()
-        players = Player.query.filter_by(profile_id=profile.id).all()
-        for pl in players:
-            pl.profile_id = None
+        Throw.query.filter_by(profile_id=profile.id).delete(synchronize_session=False)
+        _reset_profile_players(profile.id, unlink=True)
         db.session.delete(profile)
         db.session.commit()
         return jsonify({"status": "deleted"})
@@ -397,8 +689,9 @@ def profile_modify(profile_id):
 
 @app.route("/api/profiles/<int:profile_id>/reset", methods=["POST"])
 def profile_reset(profile_id):
-    profile = Profile.query.get_or_404(profile_id)
-    Throw.query.filter_by(profile_id=profile.id).delete()
+    profile = _get_or_404(Profile, profile_id)
+    Throw.query.filter_by(profile_id=profile.id).delete(synchronize_session=False)
+    _reset_profile_players(profile.id)
     db.session.commit()
     return jsonify({"status": "reset"})
 
@@ -415,41 +708,75 @@ def profile_stats(profile_id):
     - best_game_id (game id with the lowest total throws by this profile)
     - best_game_throws (number of throws in that best game)
     - overall_thrown_darts (total throws across all games)
+    Results are cached per state of the profile's throws (see below), so throws in other games
+    do not invalidate them.
     """
-    profile = Profile.query.get_or_404(profile_id)
-
-    # All throws tied to this profile (ordered)
-    throws = Throw.query.filter_by(profile_id=profile.id).order_by(Throw.timestamp).all()
-    overall_thrown_darts = len(throws)
-    total_scored = sum(t.value * t.multiplier for t in throws)
+    # One cheap indexed query fingerprints everything the payload depends on: the name, and the
+    # throw count plus newest throw id (ids only grow, and deletions change the count).
+    fingerprint = (
+        db.session.query(Profile.name, func.count(Throw.id), func.max(Throw.id))
+        .outerjoin(Throw, Throw.profile_id == Profile.id)
+        .filter(Profile.id == profile_id)
+        .group_by(Profile.id)
+        .first()
+    )
+    if fingerprint is None:
+        abort(404)
+    name, throw_count, last_throw_id = fingerprint
+    cache_key = f"profile_stats:{profile_id}:{throw_count}:{last_throw_id}:{name}"
+    stats = cache.get(cache_key)
+    if stats is None:
+        stats = _compute_profile_stats(profile_id)
+        # the key changes whenever the stats would, so entries never go stale
+        cache.set(cache_key, stats, timeout=0)
+    return jsonify(stats)
+
+
+def _compute_profile_stats(profile_id):
+    """Build the profile_stats payload from the database (aborts with 404 for unknown profiles)."""
+    profile = _get_or_404(Profile, profile_id)
+
+    # Overall totals across every throw tied to this profile
+    overall_thrown_darts, total_scored = (
+        db.session.query(func.count(Throw.id), func.coalesce(func.sum(Throw.scored), 0))
+        .filter(Throw.profile_id == profile.id)
+        .one()
+    )
     overall_avg_per_throw = (total_scored / overall_thrown_darts) if overall_thrown_darts else 0
     overall_avg_3dart = overall_avg_per_throw * 3
 
-    # Group throws by game id (via t.player.game_id). Some throws may have player or game missing; skip None games.
-    game_groups = defaultdict(list)
-    for t in throws:
-        game_id = None
-        if t.player and t.player.game_id:
-            game_id = t.player.game_id
-        # Only count throws that can be associated with a game
-        if game_id is not None:
-            game_groups[game_id].append(t)
+    # Per-game totals and first-9 sums, grouped in SQL. Throws are numbered per game in time
+    # order; throws whose player or game is missing are not associated with a game and skipped.
+    ranked = (
+        db.session.query(
+            Player.game_id.label("game_id"),
+            Throw.scored.label("scored"),
+            Throw.timestamp.label("ts"),
+            func.row_number().over(partition_by=Player.game_id, order_by=(Throw.timestamp, Throw.id)).label("rn"),
+        )
+        .join(Player, Throw.player_id == Player.id)
+        .filter(Throw.profile_id == profile.id, Player.game_id.isnot(None))
+        .subquery()
+    )
+    per_game = (
+        db.session.query(
+            ranked.c.game_id,
+            func.count().label("n"),
+            func.sum(case((ranked.c.rn <= 9, ranked.c.scored))).label("sum_first9"),
+            func.count(case((ranked.c.rn <= 9, 1))).label("n_first9"),
+        )
+        .group_by(ranked.c.game_id)
+        .order_by(func.min(ranked.c.ts), ranked.c.game_id)
+        .all()
+    )
 
     # Per-game metrics: first-9 average (3-dart), total throws
-    per_game_first9_3dart = []
-    game_throw_counts = {}
-    for gid, gthrows in game_groups.items():
-        gthrows_sorted = sorted(gthrows, key=lambda x: x.timestamp)
-        game_throw_counts[gid] = len(gthrows_sorted)
-        first9 = gthrows_sorted[:9]
-        if first9:
-            sum_first9 = sum(tt.value * tt.multiplier for tt in first9)
-            avg_per_throw_first9 = sum_first9 / len(first9)
-            per_game_first9_3dart.append(avg_per_throw_first9 * 3)
+    per_game_first9_3dart = [row.sum_first9 / row.n_first9 * 3 for row in per_game]
+    game_throw_counts = {row.game_id: row.n for row in per_game}
 
     best_first9 = max(per_game_first9_3dart) if per_game_first9_3dart else 0
     overall_first9_avg = (sum(per_game_first9_3dart) / len(per_game_first9_3dart)) if per_game_first9_3dart else 0
-    count_games = len(game_groups)
+    count_games = len(game_throw_counts)
 
     # Best game: the game where this profile used the fewest throws (i.e., most efficient)
     best_game_id = None
@@ -459,19 +786,80 @@ def profile_stats(profile_id):
         best_game_id = min(game_throw_counts, key=lambda k: game_throw_counts[k])
         best_game_throws = game_throw_counts[best_game_id]
 
-    return jsonify(
+    return {
+        "profile_id": profile.id,
+        "name": profile.name,
+        "overall_avg_3dart": round(overall_avg_3dart, 2),
+        "best_first9_avg_3dart": round(best_first9, 2),
+        "overall_first9_avg_3dart": round(overall_first9_avg, 2),
+        "count_games": count_games,
+        "best_game_id": best_game_id,
+        "best_game_throws": best_game_throws,
+        "overall_thrown_darts": overall_thrown_darts,
+    }
+
+
+# Leaderboard across all profiles
+@app.route("/api/leaderboard", methods=["GET"])
+def leaderboard():
+    """
+    Returns one entry per profile that has thrown darts, best 3-dart average first:
+      [{ "profile_id", "name", "thrown_darts", "count_games", "avg_3dart", "first9_avg_3dart" }, ...]
+    first9_avg_3dart is over the first nine darts of every game the profile played.
+    Results are cached until the next write bumps the data generation.
+    """
+    cache_key = f"leaderboard:{_data_generation()}"
+    board = cache.get(cache_key)
+    if board is None:
+        board = _compute_leaderboard()
+        cache.set(cache_key, board)
+    return jsonify(board)
+
+
+def _compute_leaderboard():
+    """Aggregate every profile's throws in one SQL pass (throws numbered per profile and game)."""
+    ranked = (
+        db.session.query(
+            Throw.profile_id.label("profile_id"),
+            Player.game_id.label("game_id"),
+            Throw.scored.label("scored"),
+            func.row_number()
+            .over(partition_by=(Throw.profile_id, Player.game_id), order_by=(Throw.timestamp, Throw.id))
+            .label("rn"),
+        )
+        .outerjoin(Player, Throw.player_id == Player.id)
+        .filter(Throw.profile_id.isnot(None))
+        .subquery()
+    )
+    totals = (
+        db.session.query(
+            ranked.c.profile_id,
+            func.count().label("n"),
+            func.sum(ranked.c.scored).label("total"),
+            func.count(func.distinct(ranked.c.game_id)).label("games"),
+            func.sum(case((ranked.c.rn <= 9, ranked.c.scored))).label("sum_first9"),
+            func.count(case((ranked.c.rn <= 9, 1))).label("n_first9"),
+        )
+        .group_by(ranked.c.profile_id)
+        .subquery()
+    )
+    rows = (
+        db.session.query(Profile.id, Profile.name, totals)
+        .join(totals, totals.c.profile_id == Profile.id)
+        .order_by((totals.c.total * 1.0 / totals.c.n).desc(), Profile.name)
+        .all()
+    )
+    return [
         {
-            "profile_id": profile.id,
-            "name": profile.name,
-            "overall_avg_3dart": round(overall_avg_3dart, 2),
-            "best_first9_avg_3dart": round(best_first9, 2),
-            "overall_first9_avg_3dart": round(overall_first9_avg, 2),
-            "count_games": count_games,
-            "best_game_id": best_game_id,
-            "best_game_throws": best_game_throws,
-            "overall_thrown_darts": overall_thrown_darts,
+            "profile_id": r.id,
+            "name": r.name,
+            "thrown_darts": r.n,
+            "count_games": r.games,
+            "avg_3dart": round(r.total / r.n * 3, 2),
+            "first9_avg_3dart": round(r.sum_first9 / r.n_first9 * 3, 2),
         }
-    )
+        for r in rows
+    ]
 
 
 # Simple settings API so the frontend can persist/retrieve preferences and last-active-game
@@ -495,7 +883,7 @@ def settings_api():
             )
         return jsonify(s.to_dict())
 
-    data = request.json or {}
+    data = _json_body()
     try:
         s = Settings.query.first()
         if not s:
@@ -528,42 +916,52 @@ def settings_api():
         return jsonify({"error": "Failed to update settings", "details": str(e)}), 500
 
 
+def _schema_diagnostics():
+    """
+    Column names of the player and throw tables (SQLite only), for diagnosing missing-column
+    errors on older DBs. Failures are recorded under "error" rather than raised.
+    """
+    diag = {}
+    try:
+        engine = db.get_engine()
+    except Exception:
+        engine = db.engine
+    if not (engine and getattr(engine, "dialect", None) and engine.dialect.name == "sqlite"):
+        return diag
+    try:
+        conn = engine.connect()
+        try:
+            res_p = conn.execute(text("PRAGMA table_info('player')")).fetchall()
+            res_t = conn.execute(text("PRAGMA table_info('throw')")).fetchall()
+            diag["player"] = [r[1] for r in res_p]
+            diag["throw"] = [r[1] for r in res_t]
+        except Exception as inner_pr:
+            # If PRAGMA fails, record the exception message
+            diag["error"] = f"failed to read PRAGMA: {inner_pr}"
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+    except Exception:
+        # If even attempting to connect fails, note that
+        diag["error"] = "could not connect to engine for PRAGMA"
+    return diag
+
+
 # Game creation
 @app.route("/api/new_game", methods=["POST"])
 def new_game():
-    payload = request.json or {}
-    # Ensure schema is compatible before creating Player rows (helps with older SQLite DBs)
-    ensure_schema_compatibility()
+    payload = _json_body()
 
-    # Diagnostic container to capture SQLite table_info (populated when possible)
+    # Diagnostic container to capture SQLite table_info. Only gathered up-front in debug mode
+    # so normal game creation does not pay for the extra connection and PRAGMA reads.
     _schema_diag = {}
     try:
-        # Try to gather schema info up-front for easier diagnostics if an error occurs.
-        try:
-            engine = db.get_engine()
-        except Exception:
-            engine = db.engine
-
-        if engine and getattr(engine, "dialect", None) and engine.dialect.name == "sqlite":
-            conn = None
-            try:
-                conn = engine.connect()
-                try:
-                    res_p = conn.execute(text("PRAGMA table_info('player')")).fetchall()
-                    res_t = conn.execute(text("PRAGMA table_info('throw')")).fetchall()
-                    _schema_diag["player"] = [r[1] for r in res_p]
-                    _schema_diag["throw"] = [r[1] for r in res_t]
-                    app.logger.debug("Schema diagnostic - player columns: %s", _schema_diag["player"])
-                    app.logger.debug("Schema diagnostic - throw columns: %s", _schema_diag["throw"])
-                except Exception as inner_pr:
-                    # If PRAGMA fails, record the exception message
-                    _schema_diag["error"] = f"failed to read PRAGMA: {inner_pr}"
-            finally:
-                if conn is not None:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
+        if app.debug:
+            _schema_diag = _schema_diagnostics()
+            app.logger.debug("Schema diagnostic - player columns: %s", _schema_diag.get("player"))
+            app.logger.debug("Schema diagnostic - throw columns: %s", _schema_diag.get("throw"))
 
         mode = payload.get("mode", "501")
         players_input = payload.get("players", [])  # expected list of profile ids OR names
@@ -599,45 +997,72 @@ def new_game():
 
         db.session.add(game)
         db.session.flush()
+        # Keep the id locally: reading game.id after commit would reload the expired game row.
+        game_id = game.id
+        # Resolve every referenced profile (by id or by name) with one query up front
+        # (ids may arrive as strings; values that are not integers match no profile)
+        profile_ids = {_coerce_id(p["profile_id"]) for p in players_input if isinstance(p, dict) and "profile_id" in p}
+        profile_ids.update(p for p in players_input if isinstance(p, int))
+        profile_ids.discard(None)
+        profile_names = {p for p in players_input if isinstance(p, str)}
+        profiles_by_id = {}
+        profiles_by_name = {}
+        if profile_ids or profile_names:
+            for prof in Profile.query.filter(or_(Profile.id.in_(profile_ids), Profile.name.in_(profile_names))):
+                profiles_by_id[prof.id] = prof
+                profiles_by_name[prof.name] = prof
+
         created_players = []
+        player_rows = []
         for p in players_input:
             profile = None
             name = None
             if isinstance(p, dict):
                 if "profile_id" in p:
-                    profile = Profile.query.get(p["profile_id"])
+                    profile = profiles_by_id.get(_coerce_id(p["profile_id"]))
                 name = p.get("name") or (profile.name if profile else "Player")
             elif isinstance(p, int):
-                profile = Profile.query.get(p)
+                profile = profiles_by_id.get(p)
                 name = profile.name if profile else f"Player {p}"
             elif isinstance(p, str):
                 name = p
-                profile = Profile.query.filter_by(name=name).first()
+                profile = profiles_by_name.get(name)
             else:
                 name = "Player"
-            pl = Player(name=name, starting_score=starting, current_score=starting, game_id=game.id)
-            if profile:
-                pl.profile_id = profile.id
-            db.session.add(pl)
-            created_players.append({"id": pl.id, "name": name, "profile_id": pl.profile_id})
-        db.session.commit()
-
-        # Persist last-active game id so frontend can restore after reload
+            profile_id = profile.id if profile else None
+            player_rows.append(
+                {
+                    "name": name,
+                    "starting_score": starting,
+                    "current_score": starting,
+                    "game_id": game_id,
+                    "profile_id": profile_id,
+                }
+            )
+            created_players.append({"id": None, "name": name, "profile_id": profile_id})
+        if player_rows:
+            # One multi-row INSERT for all players instead of an ORM flush per player.
+            # RETURNING rows come back in no guaranteed order, but SQLite assigns the rowid keys
+            # of a single INSERT in ascending VALUES order, so sorting matches them to player_rows.
+            # (sort_by_parameter_order=True would make SQLAlchemy fall back to one INSERT per row.)
+            new_ids = sorted(db.session.scalars(Player.__table__.insert().returning(Player.id), player_rows))
+            for created, new_id in zip(created_players, new_ids):
+                created["id"] = new_id
+
+        # Persist last-active game id so frontend can restore after reload. It is part of the
+        # same transaction as the game, so the request commits once.
         try:
             s = Settings.query.first()
             if not s:
-                s = Settings(last_active_game_id=game.id)
+                s = Settings(last_active_game_id=game_id)
                 db.session.add(s)
             else:
-                s.last_active_game_id = game.id
-            db.session.commit()
+                s.last_active_game_id = game_id
         except Exception:
-            try:
-                db.session.rollback()
-            except Exception:
-                pass
+            logger.exception("Failed to record last_active_game_id for new game id=%s", game_id)
+        db.session.commit()
 
-        return jsonify({"game_id": game.id, "players_created": created_players})
+        return jsonify({"game_id": game_id, "players_created": created_players})
     except Exception as e:
         # On error, ensure the transaction is rolled back and return a JSON error payload
         try:
@@ -645,30 +1070,9 @@ def new_game():
         except Exception:
             pass
 
-        # Attempt to capture schema again at the moment of error if we don't already have it
-        try:
-            engine = db.get_engine()
-        except Exception:
-            engine = db.engine
-
-        if (not _schema_diag) and engine and getattr(engine, "dialect", None) and engine.dialect.name == "sqlite":
-            try:
-                conn = engine.connect()
-                try:
-                    res_p = conn.execute(text("PRAGMA table_info('player')")).fetchall()
-                    res_t = conn.execute(text("PRAGMA table_info('throw')")).fetchall()
-                    _schema_diag["player"] = [r[1] for r in res_p]
-                    _schema_diag["throw"] = [r[1] for r in res_t]
-                except Exception as inner_pr:
-                    _schema_diag["error"] = f"failed to read PRAGMA at exception time: {inner_pr}"
-                finally:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-            except Exception:
-                # If even attempting to connect fails, note that
-                _schema_diag["error"] = _schema_diag.get("error", "") + " (could not connect to engine for PRAGMA)"
+        # Capture the schema at the moment of error (debug mode only) if we don't already have it
+        if app.debug and not _schema_diag:
+            _schema_diag = _schema_diagnostics()
 
         tb = traceback.format_exc()
         # Include schema diagnostics in the response to help debugging missing-column errors
@@ -688,10 +1092,8 @@ def add_player_to_game(game_id):
       { "name": "<Player name>" }   # create a game-only player (or use profile if found)
     Returns 201 with created player info, or 4xx on error.
     """
-    # Ensure schema is compatible before touching player/throw rows (helps with older SQLite DBs)
-    ensure_schema_compatibility()
-    game = Game.query.get_or_404(game_id)
-    data = request.json or {}
+    game = _get_or_404(Game, game_id, joinedload(Game.players))
+    data = _json_body()
 
     # limit players per game to 6
     if len(game.players) >= 6:
@@ -706,7 +1108,7 @@ def add_player_to_game(game_id):
             profile_id = int(profile_id)
         except Exception:
             return jsonify({"error": "Invalid profile_id"}), 400
-        profile = Profile.query.get(profile_id)
+        profile = db.session.get(Profile, profile_id)
         if not profile:
             return jsonify({"error": "Profile not found"}), 404
         # prefer provided name, otherwise profile name
@@ -753,15 +1155,16 @@ def add_player_to_game(game_id):
             bot_type=bot_type,
         )
         db.session.add(pl)
-        db.session.commit()
-
+        db.session.flush()
+        # Build the response before commit expires pl; reading it afterwards would re-SELECT the row.
         created = {
             "id": pl.id,
-            "name": pl.name,
+            "name": display_bot_name,
             "is_bot": True,
-            "bot_type": pl.bot_type,
-            "current_score": pl.current_score,
+            "bot_type": bot_type,
+            "current_score": starting,
         }
+        db.session.commit()
         return jsonify({"player": created}), 201
 
     pl = Player(name=name, starting_score=starting, current_score=starting, game_id=game.id)
@@ -769,56 +1172,60 @@ def add_player_to_game(game_id):
         pl.profile_id = profile.id
 
     db.session.add(pl)
+    db.session.flush()
+    created = {"id": pl.id, "name": name, "profile_id": profile.id if profile else None, "current_score": starting}
     db.session.commit()
-
-    created = {"id": pl.id, "name": pl.name, "profile_id": pl.profile_id, "current_score": pl.current_score}
     return jsonify({"player": created}), 201
 
 
 # -- additional endpoints for frontend flows (starter selection & manual next-leg) --
-@app.route("/api/games/<int:game_id>/set_starter", methods=["POST"])
-def set_starter(game_id):
+def _set_player_index(game_id: int, attr: str, index_key: str):
     """
-    Set which player (by player_id) or which player index (starter_index) should start the current leg.
-    Accepts JSON:
-      { "player_id": <int> }       # sets the game's current_start_index to the index of that player
-    or
-      { "starter_index": <int> }   # sets the game's current_start_index directly (0-based)
-    Returns 200 with updated start index on success.
+    Shared body of set_starter / set_active: set the game's index column `attr` from either a
+    "player_id" (resolved to that player's index) or a 0-based index sent under `index_key`.
     """
-    game = Game.query.get_or_404(game_id)
-    data = request.json or {}
+    game = _get_or_404(Game, game_id, lazyload(Game.players))
+    data = _json_body()
     player_id = data.get("player_id")
-    starter_index = data.get("starter_index")
+    raw_index = data.get(index_key)
 
     if player_id is not None:
         try:
             player_id = int(player_id)
         except Exception:
             return jsonify({"error": "Invalid player_id"}), 400
-        # find index of that player in the game's players list (preserve order)
-        index = None
-        for idx, p in enumerate(game.players):
-            if p.id == player_id:
-                index = idx
-                break
-        if index is None:
+        # index of that player in the game's players list (preserve order)
+        idx = _player_index(game.id, player_id)
+        if idx is None:
             return jsonify({"error": "Player not part of this game"}), 404
-        game.current_start_index = index
-    elif starter_index is not None:
+    elif raw_index is not None:
         try:
-            si = int(starter_index)
+            idx = int(raw_index)
         except Exception:
-            return jsonify({"error": "Invalid starter_index"}), 400
-        if si < 0 or (len(game.players) and si >= len(game.players)):
-            return jsonify({"error": "starter_index out of range"}), 400
-        game.current_start_index = si
+            return jsonify({"error": f"Invalid {index_key}"}), 400
+        player_count = _player_count(game.id)
+        if idx < 0 or (player_count and idx >= player_count):
+            return jsonify({"error": f"{index_key} out of range"}), 400
     else:
-        return jsonify({"error": "player_id or starter_index required"}), 400
+        return jsonify({"error": f"player_id or {index_key} required"}), 400
 
-    db.session.add(game)
+    setattr(game, attr, idx)
     db.session.commit()
-    return jsonify({"status": "ok", "current_start_index": game.current_start_index})
+    # respond with the local value; reading the attribute after commit would reload the row
+    return jsonify({"status": "ok", attr: idx})
+
+
+@app.route("/api/games/<int:game_id>/set_starter", methods=["POST"])
+def set_starter(game_id):
+    """
+    Set which player (by player_id) or which player index (starter_index) should start the current leg.
+    Accepts JSON:
+      { "player_id": <int> }       # sets the game's current_start_index to the index of that player
+    or
+      { "starter_index": <int> }   # sets the game's current_start_index directly (0-based)
+    Returns 200 with updated start index on success.
+    """
+    return _set_player_index(game_id, "current_start_index", "starter_index")
 
 
 @app.route("/api/games/<int:game_id>/set_active", methods=["POST"])
@@ -831,39 +1238,7 @@ def set_active_player(game_id):
       { "active_index": <int> }    # set index directly (0-based)
     Returns 200 with updated current_active_index on success.
     """
-    game = Game.query.get_or_404(game_id)
-    data = request.json or {}
-    player_id = data.get("player_id")
-    active_index = data.get("active_index")
-
-    if player_id is not None:
-        try:
-            player_id = int(player_id)
-        except Exception:
-            return jsonify({"error": "Invalid player_id"}), 400
-        # find index of that player in the game's players list (preserve order)
-        index = None
-        for idx, p in enumerate(game.players):
-            if p.id == player_id:
-                index = idx
-                break
-        if index is None:
-            return jsonify({"error": "Player not part of this game"}), 404
-        game.current_active_index = index
-    elif active_index is not None:
-        try:
-            ai = int(active_index)
-        except Exception:
-            return jsonify({"error": "Invalid active_index"}), 400
-        if ai < 0 or (len(game.players) and ai >= len(game.players)):
-            return jsonify({"error": "active_index out of range"}), 400
-        game.current_active_index = ai
-    else:
-        return jsonify({"error": "player_id or active_index required"}), 400
-
-    db.session.add(game)
-    db.session.commit()
-    return jsonify({"status": "ok", "current_active_index": game.current_active_index})
+    return _set_player_index(game_id, "current_active_index", "active_index")
 
 
 @app.route("/api/games/<int:game_id>/next_leg", methods=["POST"])
@@ -875,22 +1250,22 @@ def next_leg(game_id):
       - rotate game.current_start_index by +1 modulo player count (to rotate starter)
     Returns the updated leg and start index.
     """
-    game = Game.query.get_or_404(game_id)
+    game = _get_or_404(Game, game_id, lazyload(Game.players))
 
     # If match already finished, disallow advancing
     if getattr(game, "finished", False):
         return jsonify({"error": "Game already finished"}), 400
 
-    # Reset all player's scores to their starting score
-    for pl in game.players:
-        pl.current_score = pl.starting_score
-        # leave per-player leg_wins/set_wins as-is; front-end will refresh these values
+    # Reset all player's scores to their starting score in one UPDATE; its row count is the
+    # player count. Leave per-player leg_wins/set_wins as-is; front-end will refresh these values.
+    count = Player.query.filter_by(game_id=game.id).update(
+        {Player.current_score: Player.starting_score}, synchronize_session=False
+    )
 
     # Increment leg counter
     game.current_leg = (game.current_leg or 1) + 1
 
     # Rotate starting index
-    count = len(game.players) if game.players is not None else 0
     if count:
         game.current_start_index = ((game.current_start_index or 0) + 1) % count
         # set the active player to the rotated start index so client reloads restore the correct active player
@@ -899,10 +1274,10 @@ def next_leg(game_id):
         except Exception:
             # best-effort: ignore if column missing / invalid
             pass
+    current_leg, current_start_index = game.current_leg, game.current_start_index
 
-    db.session.add(game)
     db.session.commit()
-    return jsonify({"status": "ok", "current_leg": game.current_leg, "current_start_index": game.current_start_index})
+    return jsonify({"status": "ok", "current_leg": current_leg, "current_start_index": current_start_index})
 
 
 # Endpoint: restart game (reset scores/leg/set counters and make game active)
@@ -915,66 +1290,49 @@ def restart_game(game_id):
     """
     logger.info("Restart requested for game id=%s", game_id)
     try:
-        game = Game.query.get_or_404(game_id)
+        game = _get_or_404(Game, game_id, lazyload(Game.players))
 
-        logger.info("Resetting %d players for game id=%s", len(game.players or []), game_id)
-        # Reset per-player scores and counters
-        for pl in game.players:
-            pl.current_score = pl.starting_score
-            try:
-                pl.leg_wins = 0
-            except Exception:
-                # older DBs may not have these columns; ignore if absent
-                logger.debug("Player %s missing leg_wins column", getattr(pl, "id", "<unknown>"))
-                pass
-            try:
-                pl.set_wins = 0
-            except Exception:
-                logger.debug("Player %s missing set_wins column", getattr(pl, "id", "<unknown>"))
-                pass
-            db.session.add(pl)
-
-        # Reset game-level counters and mark active
-        try:
-            game.current_set = 1
-        except Exception:
-            logger.debug("Game missing current_set column")
-            pass
-        try:
-            game.current_leg = 1
-        except Exception:
-            logger.debug("Game missing current_leg column")
-            pass
-        try:
-            game.current_start_index = 0
-        except Exception:
-            logger.debug("Game missing current_start_index column")
-            pass
-
-        # reset active player index to the starting index on restart
-        try:
-            game.current_active_index = getattr(game, "current_start_index", 0)
-        except Exception:
-            game.current_active_index = 0
-
-        game.finished = False
+        # Reset per-player scores and counters with a single UPDATE. The players' throws are
+        # deleted below, so the derived throw stats are cleared with them.
+        reset_count = Player.query.filter_by(game_id=game.id).update(
+            {
+                Player.current_score: Player.starting_score,
+                Player.leg_wins: 0,
+                Player.set_wins: 0,
+                Player.throw_count: 0,
+                Player.total_scored: 0,
+                Player.first9_sum: 0,
+            },
+            synchronize_session=False,
+        )
+        logger.info("Reset %d players for game id=%s", reset_count, game_id)
+
+        # Reset game-level counters, point the active player at the starter and mark the game
+        # active again, as one UPDATE
+        game_reset = {
+            "current_set": 1,
+            "current_leg": 1,
+            "current_start_index": 0,
+            "current_active_index": 0,
+            "finished": False,
+        }
+        Game.query.filter_by(id=game.id).update(game_reset, synchronize_session=False)
 
         # Remove any Throw rows for players in this game so last-visit UI clears.
         # This ensures that after a restart there are no lingering throws shown as the
-        # player's "last visit". Use a bulk delete for efficiency and avoid loading rows.
+        # player's "last visit". A single DELETE with the game's player ids as a subquery,
+        # so neither the players nor the throws are loaded.
         try:
-            player_ids = [p.id for p in (game.players or []) if getattr(p, "id", None) is not None]
-            if player_ids:
-                Throw.query.filter(Throw.player_id.in_(player_ids)).delete(synchronize_session=False)
+            game_player_ids = select(Player.id).where(Player.game_id == game.id)
+            Throw.query.filter(Throw.player_id.in_(game_player_ids)).delete(synchronize_session=False)
         except Exception:
             logger.exception("Failed to delete throws for game id=%s during restart", game_id)
 
-        db.session.add(game)
         db.session.commit()
         logger.info(
             "Game id=%s restarted successfully (current_active_index=%s)",
             game_id,
-            getattr(game, "current_active_index", None),
+            game_reset["current_active_index"],
         )
         return jsonify({"status": "ok", "message": "Game restarted"})
     except Exception as e:
@@ -997,31 +1355,25 @@ def end_game(game_id):
     """
     logger.info("End game requested for game id=%s", game_id)
     try:
-        game = Game.query.get_or_404(game_id)
+        game = _get_or_404(Game, game_id, lazyload(Game.players))
         game.finished = True
-        db.session.add(game)
-        db.session.commit()
-        logger.info("Game id=%s marked finished", game_id)
 
-        # If this game was the recorded last_active_game_id, clear it so frontend won't try to restore a finished game
+        # If this game was the recorded last_active_game_id, clear it so frontend won't try to restore
+        # a finished game. Committed together with the finished flag below.
         try:
             s = Settings.query.first()
-            if s and s.last_active_game_id == game.id:
+            if s and s.last_active_game_id == game_id:
                 logger.info(
                     "Clearing last_active_game_id (was %s) due to game end for game id=%s",
                     s.last_active_game_id,
                     game_id,
                 )
                 s.last_active_game_id = None
-                db.session.add(s)
-                db.session.commit()
         except Exception as inner_e:
             logger.exception("Failed to clear last_active_game_id after ending game id=%s: %s", game_id, inner_e)
-            try:
-                db.session.rollback()
-            except Exception:
-                logger.debug("Rollback failed after clearing last_active_game_id for game id=%s", game_id)
 
+        db.session.commit()
+        logger.info("Game id=%s marked finished", game_id)
         return jsonify({"status": "ok", "message": "Game ended"})
     except Exception as e:
         logger.exception("Failed to end game id=%s: %s", game_id, e)
@@ -1035,45 +1387,122 @@ def end_game(game_id):
 # Game state (includes per-player last visit hits and stats, legs/sets state and match history)
 @app.route("/api/game_state/<int:game_id>", methods=["GET"])
 def game_state(game_id):
+    # The scoreboard re-fetches this after every action, so serve repeat reads from the cache
+    # until the next write bumps the data generation.
+    cache_key = f"game_state:{game_id}:{_data_generation()}"
+    state = cache.get(cache_key)
+    if state is None:
+        state = _build_game_state(game_id)
+        cache.set(cache_key, state)
+    return jsonify(state)
+
+
+def _build_game_state(game_id):
+    """Build the /api/game_state payload for a game from the database (aborts with 404 if missing)."""
     # Attempt to load the game row. Missing columns on older SQLite DBs can raise
     # an OperationalError (e.g. "no such column: game.current_active_index").
     # In that case, try a best-effort schema compatibility step and retry once.
+    # Players (selectin) and the set/leg history (joined) are eager-loaded with the game;
+    # throws are fetched below with dedicated queries.
+    load_opts = [selectinload(Game.players), joinedload(Game.sets).joinedload(MatchSet.legs)]
+    if app.debug:
+        # Fail fast in development if a code path below starts lazy-loading another
+        # relationship (a silent N+1 regression otherwise).
+        load_opts.append(raiseload("*"))
     try:
-        game = Game.query.get_or_404(game_id)
+        game = db.session.get(Game, game_id, options=load_opts)
     except OperationalError:
         # Perform compatibility fixes (ALTER TABLE ... ADD COLUMN where possible)
         # then retry the query once. If this still fails the exception will propagate.
         try:
-            ensure_schema_compatibility()
+            ensure_schema_compatibility(force=True)
         except Exception:
             # If the compatibility step itself fails, re-raise to keep behavior unchanged.
             raise
-        game = Game.query.get_or_404(game_id)
+        game = db.session.get(Game, game_id, options=load_opts)
+    if game is None:
+        abort(404)
+
+    # One query for the last visit (latest 3 throws) of every player in the game: throws are
+    # numbered per player newest-first and only the first three are returned, selecting just
+    # the columns the last-visit display needs as plain tuples. Rows come back per player in
+    # chronological order.
+    throws_by_player = {}
+    player_ids = [p.id for p in game.players]
+    if player_ids:
+        latest = (
+            db.session.query(
+                Throw.player_id.label("player_id"),
+                Throw.value.label("value"),
+                Throw.multiplier.label("multiplier"),
+                Throw.x.label("x"),
+                Throw.y.label("y"),
+                Throw.timestamp.label("timestamp"),
+                Throw.id.label("id"),
+                func.row_number()
+                .over(partition_by=Throw.player_id, order_by=(Throw.timestamp.desc(), Throw.id.desc()))
+                .label("rn"),
+            )
+            .filter(Throw.player_id.in_(player_ids))
+            .subquery()
+        )
+        rows = (
+            db.session.query(
+                latest.c.player_id, latest.c.value, latest.c.multiplier, latest.c.x, latest.c.y, latest.c.timestamp
+            )
+            .filter(latest.c.rn <= 3)
+            .order_by(latest.c.player_id, latest.c.timestamp, latest.c.id)
+            .all()
+        )
+        throws_by_player = {pid: list(group) for pid, group in groupby(rows, key=itemgetter(0))}
+
+    # Profile-backed stats span all of a profile's games. Aggregate them in SQL for every profile
+    # in the game at once: one row per profile with its throw count, total and first-9 sum
+    # (throws numbered per profile in time order).
+    stats_by_profile = {}
+    profile_ids = {p.profile_id for p in game.players if p.profile_id}
+    if profile_ids:
+        ranked = (
+            db.session.query(
+                Throw.profile_id.label("profile_id"),
+                Throw.scored.label("scored"),
+                func.row_number()
+                .over(partition_by=Throw.profile_id, order_by=(Throw.timestamp, Throw.id))
+                .label("rn"),
+            )
+            .filter(Throw.profile_id.in_(profile_ids))
+            .subquery()
+        )
+        rows = (
+            db.session.query(
+                ranked.c.profile_id,
+                func.count(),
+                func.coalesce(func.sum(ranked.c.scored), 0),
+                func.coalesce(func.sum(case((ranked.c.rn <= 9, ranked.c.scored))), 0),
+            )
+            .group_by(ranked.c.profile_id)
+            .all()
+        )
+        stats_by_profile = {pid: (count, total, first9) for pid, count, total, first9 in rows}
+
     players_out = []
     # produce per-player view
     for p in game.players:
         # last visit (up to 3 throws)
-        throws = Throw.query.filter_by(player_id=p.id).order_by(Throw.timestamp.desc()).limit(3).all()
-        throws_chrono = list(reversed(throws))
+        throws_chrono = throws_by_player.get(p.id, [])
         last_visit_score = sum(t.value * t.multiplier for t in throws_chrono) if throws_chrono else 0
-        last_visit_hits = []
-        for t in throws_chrono:
-            if t.value == 25 and t.multiplier == 2:
-                label = "BULL"
-            elif t.value == 25:
-                label = "SBULL"
-            else:
-                prefix = "T" if t.multiplier == 3 else ("D" if t.multiplier == 2 else "S")
-                label = f"{prefix}{t.value}"
-            hit = {
-                "value": t.value,
-                "multiplier": t.multiplier,
-                "label": label,
-                "x": t.x,
-                "y": t.y,
-                "timestamp": t.timestamp.isoformat() if t.timestamp else None,
+        # rows are plain column tuples (player_id, value, multiplier, x, y, timestamp)
+        last_visit_hits = [
+            {
+                "value": v,
+                "multiplier": m,
+                "label": DART_LABELS.get((v, m)) or _dart_label(v, m),
+                "x": x,
+                "y": y,
+                "timestamp": ts.isoformat() if ts else None,
             }
-            last_visit_hits.append(hit)
+            for _, v, m, x, y, ts in throws_chrono
+        ]
         # compute stats (profile-backed if present, otherwise per-player)
         total_scored = 0
         throw_count = 0
@@ -1081,25 +1510,19 @@ def game_state(game_id):
         avg_3dart = 0
         first9_avg_3dart = 0
         if p.profile_id:
-            profile_throws = Throw.query.filter_by(profile_id=p.profile_id).order_by(Throw.timestamp).all()
-            total_scored = sum(t.value * t.multiplier for t in profile_throws)
-            throw_count = len(profile_throws)
+            throw_count, total_scored, sum_first9 = stats_by_profile.get(p.profile_id, (0, 0, 0))
             avg_per_throw = (total_scored / throw_count) if throw_count else 0
             avg_3dart = avg_per_throw * 3
-            first9 = profile_throws[:9]
-            sum_first9 = sum(t.value * t.multiplier for t in first9)
-            n_first9 = len(first9)
+            n_first9 = min(throw_count, 9)
             first9_avg_3dart = (sum_first9 / n_first9 * 3) if n_first9 else 0
         else:
-            all_throws = Throw.query.filter_by(player_id=p.id).order_by(Throw.timestamp).all()
-            total_scored = sum(t.value * t.multiplier for t in all_throws)
-            throw_count = len(all_throws)
+            # game-only players: read the stats maintained by register_throw
+            total_scored = p.total_scored or 0
+            throw_count = p.throw_count or 0
             avg_per_throw = (total_scored / throw_count) if throw_count else 0
             avg_3dart = avg_per_throw * 3
-            first9 = all_throws[:9]
-            sum_first9 = sum(t.value * t.multiplier for t in first9)
-            n_first9 = len(first9)
-            first9_avg_3dart = (sum_first9 / n_first9 * 3) if n_first9 else 0
+            n_first9 = min(throw_count, 9)
+            first9_avg_3dart = ((p.first9_sum or 0) / n_first9 * 3) if n_first9 else 0
 
         players_out.append(
             {
@@ -1117,7 +1540,7 @@ def game_state(game_id):
                 "last_visit_hits": last_visit_hits,
                 "suggestion": (
                     find_checkout(p.current_score)
-                    if (p.current_score <= 170 and p.current_score > 0 and str(game.mode).lower().endswith("01"))
+                    if (p.current_score <= 170 and p.current_score > 0 and game.is_x01)
                     else None
                 ),
                 # Bot metadata so the client can detect bots and simulate them; defaults for legacy rows.
@@ -1130,11 +1553,9 @@ def game_state(game_id):
 
     # Build match-level info and history
     history = []
-    sets = MatchSet.query.filter_by(game_id=game.id).order_by(MatchSet.set_number).all()
-    for s in sets:
-        legs = []
-        for lg in sorted(s.legs, key=lambda L: L.leg_number):
-            legs.append({"leg_number": lg.leg_number, "winner_player_id": lg.winner_player_id})
+    # sets and legs arrive ordered by the relationships' order_by
+    for s in game.sets:
+        legs = [{"leg_number": lg.leg_number, "winner_player_id": lg.winner_player_id} for lg in s.legs]
         history.append({"set_number": s.set_number, "winner_player_id": s.winner_player_id, "legs": legs})
 
     game_info = {
@@ -1151,76 +1572,152 @@ def game_state(game_id):
         "finished": bool(game.finished),
     }
 
-    return jsonify({"game": game_info, "players": players_out, "history": history})
+    return {"game": game_info, "players": players_out, "history": history}
+
+
+# Live game state over Server-Sent Events, for displays that follow a game without
+# re-fetching /api/game_state. Subscribers are in-process queues, so this assumes a
+# single server process.
+STREAM_KEEPALIVE_SECONDS = 15
+# Each open stream occupies one server thread for as long as the client stays connected
+# (gunicorn.conf.py runs 8), so only this many may be open at once across all games.
+MAX_STREAM_SUBSCRIBERS = 4
+_stream_subscribers = defaultdict(list)
+_stream_lock = threading.Lock()
+
+
+def _publish_game_state(game_id):
+    """Push the current state of a game to its stream subscribers (no-op without subscribers)."""
+    with _stream_lock:
+        subscribers = list(_stream_subscribers.get(game_id, ()))
+    if not subscribers:
+        return
+    # Built fresh rather than through the game_state cache: the data generation is only
+    # bumped once the current request has finished.
+    g.query_bucket = "publish_queries"
+    try:
+        data = app.json.dumps(_build_game_state(game_id))
+    finally:
+        g.query_bucket = "queries"
+    for q in subscribers:
+        q.put(data)
 
 
-# Throw API - accepts optional normalized x,y and records profile_id if player has one
-@app.route("/api/throw", methods=["POST"])
-def register_throw():
+@app.after_request
+def _publish_after_game_write(response):
     """
-    Register a single dart throw. This endpoint now handles:
-      - X01-style games (301/501/701/...) including leg/set management
-      - Cricket and other modes are left to existing logic (no change here yet)
-    Returns structured JSON statuses:
-      - ok: normal throw recorded
-      - bust: throw recorded but busted
-      - invalid_finish_needs_double: finish invalid (needs double)
-      - leg_won: a leg was won (includes updated leg/set counters)
-      - set_won: a set was won
-      - match_won: match finished (winner)
+    Push the new state to stream subscribers after every successful write to a game: routes
+    under /api/games/<game_id>/ name the game in the URL, the throw endpoints (which only
+    know the player) record it in g.changed_game_id.
     """
-    data = request.json or {}
-    player_id = data.get("player_id")
-    if player_id is None:
-        return jsonify({"error": "player_id required"}), 400
+    if request.method == "GET" or response.status_code >= 400:
+        return response
+    game_id = g.get("changed_game_id") or (request.view_args or EMPTY).get("game_id")
+    if game_id is not None:
+        try:
+            _publish_game_state(game_id)
+        except Exception:
+            # A failed push must not turn the already committed write into an error
+            logger.exception("Publishing state of game %s to its streams failed", game_id)
+    return response
 
-    value = int(data.get("value", 0))
-    multiplier = int(data.get("multiplier", 0))
-    x = data.get("x")
-    y = data.get("y")
 
-    # Ensure DB schema compatibility (best-effort) before manipulating new columns
-    ensure_schema_compatibility()
+@app.route("/api/stream/<int:game_id>", methods=["GET"])
+def stream_game_state(game_id):
+    """
+    Stream the game's state as Server-Sent Events.
+    Sends the current state on connect and again after every successful write to the game
+    (throws, restart, next leg, starter/active player, end, added players); a comment line
+    is sent every STREAM_KEEPALIVE_SECONDS so idle connections stay open.
+    Each stream holds a server thread while connected, so at most MAX_STREAM_SUBSCRIBERS
+    may be open at once (across all games); further clients get 503 and should fall back
+    to polling /api/game_state.
+    """
+    q = queue.Queue()
+    with _stream_lock:
+        if sum(len(subscribers) for subscribers in _stream_subscribers.values()) >= MAX_STREAM_SUBSCRIBERS:
+            return jsonify({"error": "Too many open streams; poll /api/game_state instead"}), 503
+        _stream_subscribers[game_id].append(q)
+
+    def unsubscribe():
+        with _stream_lock:
+            subscribers = _stream_subscribers.get(game_id)
+            if subscribers and q in subscribers:
+                subscribers.remove(q)
+            if not subscribers:
+                _stream_subscribers.pop(game_id, None)
+
+    # Subscribe before reading the initial state: a write committed in between is then
+    # queued as well (at worst the client gets the same state twice) rather than missed.
+    try:
+        initial = app.json.dumps(_build_game_state(game_id))
+    except BaseException:
+        unsubscribe()
+        raise
 
-    player = Player.query.get_or_404(player_id)
-    game = player.game
+    def generate():
+        try:
+            yield f"data: {initial}\n\n"
+            while True:
+                try:
+                    data = q.get(timeout=STREAM_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {data}\n\n"
+        finally:
+            # client disconnected; drop the subscription
+            unsubscribe()
+
+    return Response(generate(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
-    # If the game has been marked finished, do not accept throws.
-    # This prevents continuing to record throws after a match has been ended.
-    if getattr(game, "finished", False):
-        return jsonify({"error": "Game finished; no further throws accepted"}), 400
 
+def _insert_throws(throw_rows: list):
+    """Insert the Throw rows collected by _apply_throw with one executemany INSERT."""
+    if throw_rows:
+        db.session.execute(Throw.__table__.insert(), throw_rows)
+
+
+def _apply_throw(player: Player, game: Game, value: int, multiplier: int, throw_rows: list, x=None, y=None):
+    """
+    Apply one dart to the player's score and the game's leg/set/match state and stage the
+    resulting rows in the session. The Throw row is appended to throw_rows as a plain dict;
+    callers write them with _insert_throws() and commit once per request.
+    Returns the response payload for the dart (see register_throw for the statuses).
+    """
     scored = value * multiplier
     new_score = player.current_score - scored
 
     # record throw
     # For bot players we do not persist per-throw stats. Still perform scoring and leg/set logic.
     is_bot = getattr(player, "is_bot", False)
-    t = None
     if not is_bot:
-        t = Throw(player_id=player.id, value=value, multiplier=multiplier)
+        row = {
+            "player_id": player.id,
+            "profile_id": player.profile_id or None,
+            "value": value,
+            "multiplier": multiplier,
+            "x": None,
+            "y": None,
+        }
         if x is not None and y is not None:
             try:
-                t.x = float(x)
-                t.y = float(y)
+                row["x"], row["y"] = float(x), float(y)
             except Exception:
-                t.x = None
-                t.y = None
-        if player.profile_id:
-            t.profile_id = player.profile_id
+                pass
+        throw_rows.append(row)
+        _record_throw_stats(player, scored)
 
     # Helper: reset scores for a new leg
     def _reset_for_new_leg():
-        # reset all player's current scores to their starting_score
-        for pl in Game.query.get(game.id).players:
-            pl.current_score = pl.starting_score
+        # reset all player's current scores to their starting_score with one UPDATE
+        # (its row count is the player count); "evaluate" keeps the loaded player in step
+        count = Player.query.filter_by(game_id=game.id).update(
+            {Player.current_score: Player.starting_score}, synchronize_session="evaluate"
+        )
         # increment leg counter on game
         game.current_leg = (game.current_leg or 1) + 1
         # rotate start index (advance by 1 modulo player count)
-        try:
-            count = len(game.players)
-        except Exception:
-            count = len(Game.query.get(game.id).players)
         if count:
             game.current_start_index = ((game.current_start_index or 0) + 1) % count
             # when a new leg starts, ensure the active player index follows the current_start_index
@@ -1231,9 +1728,8 @@ def register_throw():
 
     # Helper: start a new set
     def _start_new_set():
-        # reset per-player leg_wins to 0 and increment current_set
-        for pl in Game.query.get(game.id).players:
-            pl.leg_wins = 0
+        # reset per-player leg_wins to 0 (one UPDATE) and increment current_set
+        Player.query.filter_by(game_id=game.id).update({Player.leg_wins: 0}, synchronize_session="evaluate")
         game.current_set = (game.current_set or 1) + 1
         game.current_leg = 1
         # reset start index back to 0 or leave rotation behavior as-is; keep rotation consistent
@@ -1245,25 +1741,18 @@ def register_throw():
         return ms
 
     # X01-style modes - check for busts/finishes
-    if str(game.mode).lower().endswith("01") or game.mode in ("501", "301", "701"):
+    if game.is_x01:
         # bust conditions
         if new_score < 0 or new_score == 1:
-            if t is not None:
-                db.session.add(t)
-            db.session.commit()
-            return jsonify({"status": "bust", "current_score": player.current_score})
+            return {"status": "bust", "current_score": player.current_score}
 
         if new_score == 0:
             # must finish on a double (or double bull 50)
-            if multiplier != 2 and scored != 50:
-                if t is not None:
-                    db.session.add(t)
-                db.session.commit()
-                return jsonify({"status": "invalid_finish_needs_double", "current_score": player.current_score})
+            if (value, multiplier) not in VALID_FINISH:
+                return {"status": "invalid_finish_needs_double", "current_score": player.current_score}
 
             # valid finish -> record throw and process leg/set/match transitions
             player.current_score = 0
-            db.session.add(t)
             # increment leg wins for this player
             player.leg_wins = (player.leg_wins or 0) + 1
 
@@ -1275,10 +1764,14 @@ def register_throw():
                 db.session.add(ms)
                 db.session.flush()
 
-            # record the leg
-            leg_number = (len(ms.legs) + 1) if ms.legs is not None else 1
-            leg_record = Leg(match_set_id=ms.id, leg_number=leg_number, winner_player_id=player.id)
-            db.session.add(leg_record)
+            # record the leg with one Core INSERT; its number is counted in SQL from the legs
+            # already in the set, so the set's leg collection is never loaded
+            legs_so_far = select(func.count(Leg.id)).where(Leg.match_set_id == ms.id).scalar_subquery()
+            db.session.execute(
+                Leg.__table__.insert().values(
+                    match_set_id=ms.id, leg_number=legs_so_far + 1, winner_player_id=player.id
+                )
+            )
 
             # Evaluate whether this leg win also wins the set
             leg_threshold = game.legs_to_win or 0
@@ -1309,60 +1802,148 @@ def register_throw():
                 # If sets_to_win configured and reached -> match won
                 if set_threshold and player.set_wins >= set_threshold:
                     game.finished = True
-                    db.session.add(game)
-                    db.session.add(player)
-                    db.session.commit()
-                    return jsonify(
-                        {
-                            "status": "match_won",
-                            "player_id": player.id,
-                            "player_name": player.name,
-                            "set_wins": player.set_wins,
-                            "message": f"{player.name} has won the match!",
-                        }
-                    )
-
-                db.session.add(game)
-                db.session.add(player)
-                db.session.commit()
-                return jsonify(
-                    {
-                        "status": "set_won",
+                    return {
+                        "status": "match_won",
                         "player_id": player.id,
                         "player_name": player.name,
                         "set_wins": player.set_wins,
-                        "message": f"{player.name} has won set {game.current_set - 1}.",
+                        "message": f"{player.name} has won the match!",
                     }
-                )
+
+                return {
+                    "status": "set_won",
+                    "player_id": player.id,
+                    "player_name": player.name,
+                    "set_wins": player.set_wins,
+                    "message": f"{player.name} has won set {game.current_set - 1}.",
+                }
 
             # Otherwise just finish the leg and start next leg
             # Reset all players' current_score for the next leg
             _reset_for_new_leg()
-            db.session.add(game)
-            db.session.add(player)
-            db.session.commit()
 
-            return jsonify(
-                {
-                    "status": "leg_won",
-                    "player_id": player.id,
-                    "player_name": player.name,
-                    "leg_wins": player.leg_wins,
-                    "message": f"{player.name} has won leg {game.current_leg - 1} of set {game.current_set}.",
-                }
-            )
+            return {
+                "status": "leg_won",
+                "player_id": player.id,
+                "player_name": player.name,
+                "leg_wins": player.leg_wins,
+                "message": f"{player.name} has won leg {game.current_leg - 1} of set {game.current_set}.",
+            }
 
         # non-finishing valid throw: subtract score and persist
         player.current_score = new_score
-        db.session.add(t)
-        db.session.add(player)
-        db.session.commit()
-        return jsonify({"status": "ok", "current_score": player.current_score})
+        return {"status": "ok", "current_score": player.current_score}
 
     # Fallback: non-X01 mode (Cricket, training, etc.) - just record the throw by default
-    db.session.add(t)
+    return {"status": "ok", "current_score": player.current_score}
+
+
+# Throw API - accepts optional normalized x,y and records profile_id if player has one
+@app.route("/api/throw", methods=["POST"])
+def register_throw():
+    """
+    Register a single dart throw. This endpoint now handles:
+      - X01-style games (301/501/701/...) including leg/set management
+      - Cricket and other modes are left to existing logic (no change here yet)
+    Returns structured JSON statuses:
+      - ok: normal throw recorded
+      - bust: throw recorded but busted
+      - invalid_finish_needs_double: finish invalid (needs double)
+      - leg_won: a leg was won (includes updated leg/set counters)
+      - set_won: a set was won
+      - match_won: match finished (winner)
+    """
+    data = _json_body()
+    player_id = data.get("player_id")
+    if player_id is None:
+        return jsonify({"error": "player_id required"}), 400
+    try:
+        player_id = int(player_id)
+    except (TypeError, ValueError):
+        return jsonify({"error": "Invalid player_id"}), 400
+
+    dart = _parse_dart(data)
+    if dart is None:
+        return jsonify({"error": "value and multiplier must be integers"}), 400
+    value, multiplier = dart
+    x = data.get("x")
+    y = data.get("y")
+
+    # Schema compatibility runs once at startup. Should a column still be missing (e.g. the DB file
+    # was swapped while running), repair it and retry the load once, as game_state does.
+    load_opt = joinedload(Player.game).lazyload(Game.players)
+    try:
+        player = _get_or_404(Player, player_id, load_opt)
+    except OperationalError:
+        db.session.rollback()
+        ensure_schema_compatibility(force=True)
+        player = _get_or_404(Player, player_id, load_opt)
+    game = player.game
+
+    # If the game has been marked finished, do not accept throws.
+    # This prevents continuing to record throws after a match has been ended.
+    if getattr(game, "finished", False):
+        return jsonify({"error": "Game finished; no further throws accepted"}), 400
+
+    game_id = game.id  # read before the commit expires the loaded game
+    throw_rows = []
+    result = _apply_throw(player, game, value, multiplier, throw_rows, x, y)
+    _insert_throws(throw_rows)
+    db.session.commit()
+    g.changed_game_id = game_id  # streamed by _publish_after_game_write
+    return jsonify(result)
+
+
+# Batched variant of /api/throw for a whole visit: one request and one commit for up to three darts.
+# Provide two routes for compatibility: /throws_batch and /throw_batch
+@app.route("/api/throws_batch", methods=["POST"])
+@app.route("/api/throw_batch", methods=["POST"])
+def register_throws_batch():
+    """
+    Register a visit of up to 3 darts in a single transaction.
+    Accepts JSON:
+      { "player_id": <int>, "throws": [{"value": <int>, "multiplier": <int>, "x": <float>, "y": <float>}, ...] }
+    The darts list may also be sent as "darts".
+    Darts are applied in order with the same rules as /api/throw. Processing stops at the first
+    dart that ends the visit (bust, invalid finish, leg/set/match won); later darts are ignored.
+    Returns { "results": [<per-dart /api/throw payload>, ...], "current_score": <int> }.
+    """
+    data = _json_body()
+    player_id = data.get("player_id")
+    if player_id is None:
+        return jsonify({"error": "player_id required"}), 400
+    try:
+        player_id = int(player_id)
+    except (TypeError, ValueError):
+        return jsonify({"error": "Invalid player_id"}), 400
+    darts = data.get("throws", data.get("darts"))
+    if not isinstance(darts, list) or not 1 <= len(darts) <= 3:
+        return jsonify({"error": "throws must be a list of 1 to 3 darts"}), 400
+    parsed = [_parse_dart(dart) for dart in darts]
+    if None in parsed:
+        return jsonify({"error": "value and multiplier must be integers"}), 400
+
+    player = _get_or_404(Player, player_id, joinedload(Player.game).lazyload(Game.players))
+    game = player.game
+
+    if getattr(game, "finished", False):
+        return jsonify({"error": "Game finished; no further throws accepted"}), 400
+
+    results = []
+    throw_rows = []
+    for dart, (value, multiplier) in zip(darts, parsed):
+        result = _apply_throw(player, game, value, multiplier, throw_rows, dart.get("x"), dart.get("y"))
+        results.append(result)
+        if result["status"] != "ok":
+            break
+
+    # all darts of the visit in one INSERT; the player's new score is one UPDATE at flush
+    _insert_throws(throw_rows)
+    # read before the commit expires the loaded rows (each read would reload them)
+    game_id, current_score = game.id, player.current_score
     db.session.commit()
-    return jsonify({"status": "ok", "current_score": player.current_score})
+    g.changed_game_id = game_id  # streamed by _publish_after_game_write
+    return jsonify({"results": results, "current_score": current_score})
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 
 # Simple checkout utility.
-# Provides a mapping for common checkouts up to 170 and a fallback search for 1-3 dart finishes that end on a double.
+# Provides a mapping for common checkouts up to 170, completed at import with 1-3 dart finishes that end on a double.
 
 COMMON_CHECKOUTS = {
     170: ['T20','T20','BULL'],
@@ -26,6 +26,8 @@ DOUBLES = [(i,2,f"D{i}") for i in range(1,21)]
 TRIPLES = [(i,3,f"T{i}") for i in range(1,21)]
 BULL = [(25,1,"SBULL"), (25,2,"BULL")]  # single bull 25, double bull 50 ("BULL")
 ALL_THROWS = TRIPLES + DOUBLES + SINGLES + BULL
+# Valid finishing darts: any double, or the bull (50)
+FINISHERS = DOUBLES + [(25,2,"BULL")]
 
 def format_throw(t):
     val, mult, name = t
@@ -33,28 +35,31 @@ def format_throw(t):
         return name
     return f"{name}"
 
-def find_checkout(score):
-    # check common table first
-    if score in COMMON_CHECKOUTS:
-        return COMMON_CHECKOUTS[score]
-    # Try to find 1, 2 or 3 dart checkouts ending on a double
-    # A finishing throw must be a double (or bull 50)
-    solutions = []
+def _build_checkout_table():
+    """
+    Precompute the checkout for every reachable score. Entries are added in the same order the
+    search used to try them (common table, then 1, 2 and 3 dart finishes ending on a double), and
+    setdefault keeps the first one found, so each score maps to the same suggestion as before.
+    """
+    table = {score: tuple(darts) for score, darts in COMMON_CHECKOUTS.items()}
     # 1 dart finish - must be double
-    for d in DOUBLES + [(25,2,"BULL")]:
-        if d[0] * d[1] == score:
-            return [d[2]]
+    for d in FINISHERS:
+        table.setdefault(d[0] * d[1], (d[2],))
     # 2 dart finish: first any throw, last double
     for first in ALL_THROWS:
-        for last in DOUBLES + [(25,2,"BULL")]:
-            if first[0]*first[1] + last[0]*last[1] == score:
-                return [first[2], last[2]]
-    # 3 dart finish: try all combinations (may be heavy but limited set)
+        for last in FINISHERS:
+            table.setdefault(first[0]*first[1] + last[0]*last[1], (first[2], last[2]))
+    # 3 dart finish: all combinations (done once at import)
     for first in ALL_THROWS:
         for second in ALL_THROWS:
             subtotal = first[0]*first[1] + second[0]*second[1]
-            required = score - subtotal
-            for last in DOUBLES + [(25,2,"BULL")]:
-                if last[0]*last[1] == required:
-                    return [first[2], second[2], last[2]]
-    return None
\ No newline at end of file
+            for last in FINISHERS:
+                table.setdefault(subtotal + last[0]*last[1], (first[2], second[2], last[2]))
+    return table
+
+# score -> checkout darts; the domain is fixed (at most 170), so the search runs once at import.
+# Values are tuples so the shared results cannot be mutated by a caller.
+CHECKOUT_TABLE = _build_checkout_table()
+
+def find_checkout(score):
+    return CHECKOUT_TABLE.get(score)
@@ -0,0 +1,17 @@
+# Gunicorn settings for serving the app in production:
+#   gunicorn app:app
+# (app.run() in app.py is the single-threaded development server.)
+
+bind = "0.0.0.0:5000"
+
+# One process only: the response cache, its data generation counter and the game-state
+# stream subscribers live in process memory, so a second worker would serve stale data
+# and miss stream updates. Concurrency comes from threads instead; with SQLite in WAL mode
+# reads proceed while a throw is being committed.
+workers = 1
+worker_class = "gthread"
+# Each open /api/stream connection occupies a thread for its lifetime.
+threads = 8
+
+# Streams send a keepalive every STREAM_KEEPALIVE_SECONDS (15), well within this.
+timeout = 60
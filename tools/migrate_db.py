@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+migrate_db.py
+
+Small helper to bring the project's SQLite DB (`darts.db`) up to the current
+schema without starting the app. It adds the columns listed in MIGRATIONS that
+are missing (checked with pragma_table_xinfo, so re-running is harmless),
+backfills the per-player stats columns when it adds them, gives the
+SERVER_DEFAULTS columns their database default (rebuilding those tables, as
+SQLite cannot alter a column default in place) and creates the INDEXES, all
+in a single transaction: either every step is applied or none is. Back up
+darts.db before running it. Afterwards the plans of the per-player and
+per-profile throw lookups are printed; they should report
+"SEARCH throw USING INDEX ...".
+
+The app adds missing columns and indexes at startup too
+(ensure_schema_compatibility) but never rebuilds tables; until this script
+has run it fills the SERVER_DEFAULTS columns from Python. Keep MIGRATIONS in
+step with COMPAT_COLUMNS and SERVER_DEFAULTS with SERVER_DEFAULT_COLUMNS in
+app.py.
+
+Usage:
+  python darts4you/tools/migrate_db.py [--db /path/to/darts.db]
+
+If --db is omitted the script will look for `darts.db` in the project root
+(one level up from this script, which matches the repo layout).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+from typing import Optional
+
+# (table, column definition) in the order they were introduced
+MIGRATIONS = (
+    ("player", "profile_id INTEGER"),
+    ("player", "leg_wins INTEGER DEFAULT 0"),
+    ("player", "set_wins INTEGER DEFAULT 0"),
+    ("player", "is_bot INTEGER DEFAULT 0"),
+    ("player", "bot_type VARCHAR(32)"),
+    ("player", "throw_count INTEGER DEFAULT 0"),
+    ("player", "total_scored INTEGER DEFAULT 0"),
+    ("player", "first9_sum INTEGER DEFAULT 0"),
+    ("throw", "profile_id INTEGER"),
+    ("throw", "x REAL"),
+    ("throw", "y REAL"),
+    # generated column; SQLite can only add VIRTUAL ones to an existing table
+    ("throw", "scored INTEGER GENERATED ALWAYS AS (value * multiplier) VIRTUAL"),
+    ("game", "legs_to_win INTEGER"),
+    ("game", "sets_to_win INTEGER"),
+    ("game", "current_set INTEGER DEFAULT 1"),
+    ("game", "current_leg INTEGER DEFAULT 1"),
+    ("game", "first_throw_method VARCHAR(32) DEFAULT 'random'"),
+    ("game", "current_start_index INTEGER DEFAULT 0"),
+    ("game", "current_active_index INTEGER DEFAULT 0"),
+    ("game", "finished INTEGER DEFAULT 0"),
+)
+
+# Denormalized per-player stats; when added they are backfilled from the recorded throws
+# (the same UPDATE the app runs, so running games keep their averages)
+STATS_COLUMNS = ("player.throw_count", "player.total_scored", "player.first9_sum")
+STATS_BACKFILL = """
+UPDATE player SET
+  throw_count = (SELECT COUNT(*) FROM "throw" t WHERE t.player_id = player.id),
+  total_scored = (
+    SELECT COALESCE(SUM(t.value * t.multiplier), 0)
+    FROM "throw" t WHERE t.player_id = player.id
+  ),
+  first9_sum = (
+    SELECT COALESCE(SUM(f.scored), 0) FROM (
+      SELECT t.value * t.multiplier AS scored FROM "throw" t
+      WHERE t.player_id = player.id ORDER BY t.timestamp, t.id LIMIT 9
+    ) f
+  )
+"""
+
+# Timestamp columns filled by SQLite on insert: (table, column). Millisecond precision
+# (CURRENT_TIMESTAMP only has seconds) keeps rows created in one request in order.
+SERVER_DEFAULTS = (
+    ("profile", "created_at"),
+    ("game", "created_at"),
+    ("match_set", "created_at"),
+    ("leg", "created_at"),
+    ("throw", "timestamp"),
+)
+NOW_DEFAULT_SQL = "DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))"
+
+INDEXES = (
+    'CREATE INDEX IF NOT EXISTS ix_throw_player_ts ON "throw" (player_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS ix_throw_profile_ts ON "throw" (profile_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS ix_throw_profile_scored ON "throw" (profile_id, scored)',
+    "CREATE INDEX IF NOT EXISTS ix_player_profile ON player (profile_id)",
+)
+
+# Representative lookups whose plans should use the indexes
+PLAN_QUERIES = (
+    'SELECT * FROM "throw" WHERE player_id = 1 ORDER BY timestamp',
+    'SELECT * FROM "throw" WHERE profile_id = 1 ORDER BY timestamp',
+)
+
+# Table-valued form of PRAGMA table_xinfo (which, unlike table_info, lists generated columns).
+# The table name is a bound parameter, so the statement text is constant and sqlite3 reuses
+# its compiled statement for every table.
+COLUMNS_SQL = "SELECT name FROM pragma_table_xinfo(?)"
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    """Return the names of all columns of the given table (empty if it does not exist)."""
+    return {r[0] for r in conn.execute(COLUMNS_SQL, (table,))}
+
+
+def has_column(conn: sqlite3.Connection, table: str, col: str) -> bool:
+    """Return True if the given column exists on the given table."""
+    return col in table_columns(conn, table)
+
+
+def add_server_default(conn: sqlite3.Connection, table: str, col: str) -> bool:
+    """
+    Give an existing DATETIME column the NOW_DEFAULT_SQL default, following SQLite's
+    recommended table rebuild: create the changed table under a new name, copy the rows,
+    drop the original, rename the copy and recreate its indexes. The table's own CREATE
+    statement is edited, so every other column keeps its type and default.
+    Must run inside a transaction with foreign keys off. Returns False if the column already
+    has a default or does not exist.
+    """
+    info = {r[1]: r for r in conn.execute("SELECT * FROM pragma_table_xinfo(?)", (table,))}
+    if col not in info or info[col][4] is not None:
+        return False
+    (create_sql,) = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    index_sqls = [
+        r[0]
+        for r in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (table,)
+        )
+    ]
+    new_name = f"{table}__new"
+    new_sql, renamed = re.subn(
+        rf'^CREATE TABLE\s+"?{table}"?(?=\s*\()', f'CREATE TABLE "{new_name}"', create_sql, count=1, flags=re.I
+    )
+    new_sql, altered = re.subn(
+        rf'(\b"?{col}"?\s+DATETIME\b)', rf"\1 {NOW_DEFAULT_SQL}", new_sql, count=1, flags=re.I
+    )
+    if not (renamed and altered):
+        raise sqlite3.OperationalError(f"cannot add a default to {table}.{col}: unexpected table definition")
+    # generated columns (hidden 2/3) are recomputed by the new table and cannot be inserted into
+    cols = ", ".join(f'"{name}"' for name, r in info.items() if r[6] == 0)
+    conn.execute(new_sql)
+    conn.execute(f'INSERT INTO "{new_name}" ({cols}) SELECT {cols} FROM "{table}"')
+    conn.execute(f'DROP TABLE "{table}"')
+    conn.execute(f'ALTER TABLE "{new_name}" RENAME TO "{table}"')
+    for sql in index_sqls:
+        conn.execute(sql)
+    return True
+
+
+def migrate(conn: sqlite3.Connection) -> list[str]:
+    """
+    Apply the missing MIGRATIONS, SERVER_DEFAULTS and the INDEXES in one transaction and
+    return the descriptions of the changes made. Rolls everything back on error.
+    """
+    added = []
+    columns = {}  # table -> existing column names, read once per table
+    # Foreign key enforcement cannot be toggled inside a transaction
+    conn.execute("PRAGMA foreign_keys=OFF")
+    conn.execute("BEGIN")
+    try:
+        for table, column_sql in MIGRATIONS:
+            col = column_sql.split()[0]
+            if table not in columns:
+                columns[table] = table_columns(conn, table)
+            if col in columns[table]:
+                continue
+            conn.execute(f'ALTER TABLE "{table}" ADD COLUMN {column_sql}')
+            columns[table].add(col)
+            added.append(f"{table}.{col}")
+        if any(col in added for col in STATS_COLUMNS):
+            conn.execute(STATS_BACKFILL)
+        for table, col in SERVER_DEFAULTS:
+            if add_server_default(conn, table, col):
+                added.append(f"{table}.{col} default")
+        for sql in INDEXES:
+            conn.execute(sql)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys=ON")
+    return added
+
+
+def default_db_path() -> str:
+    """
+    Determine a sensible default path for darts.db relative to this script
+    (the project root, one level up from tools/).
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(script_dir, "..", "darts.db"))
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Add missing columns, defaults and indexes to darts.db")
+    p.add_argument("--db", help="Path to darts.db (SQLite). If omitted a default in the project is used.")
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    db_path = args.db or default_db_path()
+
+    if not os.path.exists(db_path):
+        print(f"ERROR: database file not found at: {db_path}", file=sys.stderr)
+        return 2
+
+    try:
+        # autocommit mode: transactions are managed explicitly in migrate()
+        conn = sqlite3.connect(db_path, isolation_level=None)
+    except Exception as e:
+        print(f"ERROR: failed to open database '{db_path}': {e}", file=sys.stderr)
+        return 3
+
+    try:
+        try:
+            added = migrate(conn)
+        except sqlite3.OperationalError as e:
+            print("ERROR: migration failed, no changes were applied:", e, file=sys.stderr)
+            print(
+                "Common causes: database file is locked, the file is read-only, or it is not a valid SQLite database.",
+                file=sys.stderr,
+            )
+            return 5
+        except Exception as e:
+            print("ERROR: unexpected failure during migration, no changes were applied:", e, file=sys.stderr)
+            return 6
+
+        if added:
+            print("Added: " + ", ".join(added))
+        else:
+            print("No action needed: all columns and defaults already exist.")
+        for query in PLAN_QUERIES:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+            print(f"{query}\n  " + "\n  ".join(row[-1] for row in plan))
+        return 0
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)